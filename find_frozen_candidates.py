@@ -1,23 +1,43 @@
 """
 Find verbs that should potentially be frozen based on semantic patterns.
 """
+import re
 import sys
 from pathlib import Path
-import json
+
+from src.json_loader import load_json
 
 sys.stdout.reconfigure(encoding='utf-8')
 
 # Load verbs
 verbs_path = Path(__file__).parent / "data" / "verbs.json"
-with open(verbs_path, "r", encoding="utf-8") as f:
-    verbs = json.load(f)
+verbs = load_json(verbs_path)
+
+inverted_keywords = ["belong", "cost", "happen", "missing", "lack", "please", "like"]
+# One alternation matches all keywords in a single scan of each token
+inverted_keyword_re = re.compile("|".join(map(re.escape, inverted_keywords)))
+
+# Single pass over the library: collect every category and index meaning
+# tokens (token -> positions of verbs whose meaning contains it)
+frozen = []
+dative_verbs = []  # Dative valency, not frozen (potential experiencer datives)
+modal_verbs = []
+meaning_index = {}
+for i, v in enumerate(verbs):
+    if v.get("generation_mode") == "frozen":
+        frozen.append(v)
+    elif v.get("valency") == "dat":
+        dative_verbs.append(v)
+    if v.get("modal") == True:
+        modal_verbs.append(v)
+    for token in v.get("english_meaning", "").lower().split():
+        meaning_index.setdefault(token, set()).add(i)
 
 print("=" * 80)
 print("ANALYZING VERBS FOR FROZEN CANDIDATES")
 print("=" * 80)
 
 # Check current frozen verbs
-frozen = [v for v in verbs if v.get("generation_mode") == "frozen"]
 print(f"\nCurrent frozen verbs ({len(frozen)}):")
 for v in frozen:
     has_examples = "fixed_examples" in v and v["fixed_examples"]
@@ -28,7 +48,6 @@ print("\n" + "=" * 80)
 print("DATIVE VERBS (checking for experiencer datives):")
 print("=" * 80)
 
-dative_verbs = [v for v in verbs if v.get("valency") == "dat" and v.get("generation_mode") != "frozen"]
 for v in dative_verbs:
     print(f"  - {v['infinitive']}: {v.get('english_meaning', 'N/A')}")
     print(f"    Objects: {v.get('allowed_objects', [])[:3]}")
@@ -38,7 +57,6 @@ print("\n" + "=" * 80)
 print("MODAL VERBS:")
 print("=" * 80)
 
-modal_verbs = [v for v in verbs if v.get("modal") == True]
 for v in modal_verbs:
     is_frozen = v.get("generation_mode") == "frozen"
     print(f"  - {v['infinitive']}: {v.get('english_meaning', 'N/A')} {'(frozen)' if is_frozen else '(not frozen)'}")
@@ -48,12 +66,17 @@ print("\n" + "=" * 80)
 print("VERBS WITH POTENTIALLY INVERTED SEMANTICS:")
 print("=" * 80)
 
-inverted_keywords = ["belong", "cost", "happen", "missing", "lack", "please", "like"]
-for v in verbs:
-    meaning = v.get("english_meaning", "").lower()
-    if any(kw in meaning for kw in inverted_keywords):
-        is_frozen = v.get("generation_mode") == "frozen"
-        print(f"  - {v['infinitive']}: {v.get('english_meaning', 'N/A')} {'(frozen)' if is_frozen else '(not frozen)'}")
+# Keywords match as substrings ("like" also matches "likes"), so test them
+# against the token vocabulary once instead of against every meaning
+inverted_positions = set()
+for token, positions in meaning_index.items():
+    if inverted_keyword_re.search(token):
+        inverted_positions |= positions
+
+for i in sorted(inverted_positions):
+    v = verbs[i]
+    is_frozen = v.get("generation_mode") == "frozen"
+    print(f"  - {v['infinitive']}: {v.get('english_meaning', 'N/A')} {'(frozen)' if is_frozen else '(not frozen)'}")
 
 print("\n" + "=" * 80)
 print("SUMMARY")
@@ -2,16 +2,10 @@
 CLI interface - thin wrapper around core logic.
 """
 
-import random
 from pathlib import Path
-from src.verb_model import (
-    load_verbs,
-    filter_verbs_by_level,
-    get_active_verbs,
-    select_verb_for_exercise
-)
+from src.verb_model import load_verbs, get_active_verbs, select_verb_for_exercise
 from src.exercise_templates import find_compatible_template
-from src.config import Config
+from src.config import Config, load_config
 
 
 def display_exercise(verb, exercise, config: Config):
@@ -48,12 +42,10 @@ def run_cli():
     data_dir = Path(__file__).parent.parent / "data"
     
     # Load configuration
-    from src.config import load_config
     config = load_config()
     
-    # Load base verb library
-    verbs_path = data_dir / "verbs.json"
-    all_verbs = load_verbs(verbs_path)
+    # Load the A2 verbs of the base library (filtered while parsing)
+    all_verbs = load_verbs(data_dir / "verbs.json", level="A2")
     
     # Get active verbs (default: from active_verbs.json)
     active_verb_infinitives = get_active_verbs()
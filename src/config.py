@@ -5,7 +5,7 @@ Configuration management - UI-agnostic settings.
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
-import json
+from src.json_loader import load_json
 
 
 @dataclass
@@ -24,8 +24,7 @@ class Config:
     def load(cls, json_path: Path) -> "Config":
         """Load configuration from JSON file."""
         try:
-            with open(json_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = load_json(json_path)
             return cls.from_dict(data)
         except FileNotFoundError:
             # Return default config if file doesn't exist
@@ -3,28 +3,64 @@ Exercise template system - compatibility layer for dynamic templates.
 This module provides backward-compatible functions that use the new dynamic system.
 """
 
-from typing import Optional
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 from src.verb_model import Verb
 from src.template_generator import (
     load_template_patterns,
-    generate_exercise_for_verb,
+    find_feasible_patterns,
+    generate_exercise_from_patterns,
+    build_pattern_index,
+    PatternIndex,
+    TemplatePattern,
     ExerciseInstance
 )
 
+# Default template patterns file
+TEMPLATE_PATTERNS_PATH = Path(__file__).parent.parent / "data" / "template_patterns.json"
+
 # Cache for template patterns
 _patterns_cache: Optional[list] = None
 
+# Version (modification time) of the file _patterns_cache was loaded from
+_patterns_version: Optional[float] = None
+
+# Cache for the index over the template patterns
+_pattern_index_cache: Optional[PatternIndex] = None
+
+# Cache of feasible patterns per (verb, level, patterns version). Keyed on the
+# (frozen, hashable) Verb itself, so modified copies of a verb are not served
+# the entry of the original. Only the patterns are cached: each exercise picks
+# a random subject and objects, so instances themselves must be generated fresh.
+_feasible_cache: Dict[Tuple[Verb, str, float], List[TemplatePattern]] = {}
+
 
 def _get_patterns() -> list:
-    """Get template patterns, loading from cache or file."""
-    global _patterns_cache
-    if _patterns_cache is None:
-        data_path = Path(__file__).parent.parent / "data" / "template_patterns.json"
-        _patterns_cache = load_template_patterns(data_path)
+    """
+    Get template patterns, loading from cache or file.
+    
+    The patterns are kept in memory and reloaded when template_patterns.json
+    changes.
+    """
+    global _patterns_cache, _patterns_version, _pattern_index_cache
+    version = TEMPLATE_PATTERNS_PATH.stat().st_mtime
+    if _patterns_cache is None or version != _patterns_version:
+        _patterns_cache = load_template_patterns(TEMPLATE_PATTERNS_PATH)
+        _patterns_version = version
+        _pattern_index_cache = None
+        _feasible_cache.clear()  # Entries of the previous version can no longer be hit
     return _patterns_cache
 
 
+def _get_pattern_index() -> PatternIndex:
+    """Get the index over the template patterns, building it on first use."""
+    global _pattern_index_cache
+    patterns = _get_patterns()
+    if _pattern_index_cache is None:
+        _pattern_index_cache = build_pattern_index(patterns)
+    return _pattern_index_cache
+
+
 def find_compatible_template(verb: Verb, level: str) -> Optional[ExerciseInstance]:
     """
     Find and generate a compatible exercise for the given verb and level.
@@ -35,6 +71,34 @@ def find_compatible_template(verb: Verb, level: str) -> Optional[ExerciseInstanc
     Returns:
         An ExerciseInstance (compatible with old template interface) or None
     """
+    feasible = _get_feasible_patterns(verb, level)
+    if not feasible:
+        return None
+    return generate_exercise_from_patterns(verb, feasible)
+
+
+def _get_feasible_patterns(verb: Verb, level: str) -> List[TemplatePattern]:
+    """
+    Get the patterns an exercise can be generated from.
+    
+    Memoized per (verb, level) and version of template_patterns.json, so
+    edits to the patterns file are picked up.
+    """
     patterns = _get_patterns()
-    return generate_exercise_for_verb(verb, level, patterns)
+    key = (verb, level, _patterns_version)
+    feasible = _feasible_cache.get(key)
+    if feasible is None:
+        feasible = find_feasible_patterns(verb, level, patterns, _get_pattern_index())
+        _feasible_cache[key] = feasible
+    return feasible
+
+
+def has_compatible_template(verb: Verb, level: str) -> bool:
+    """
+    Check whether an exercise can be generated for the given verb and level.
+    
+    Memoized per (verb, level) and patterns file version, so repeated
+    selection passes do not regenerate exercises just to test compatibility.
+    """
+    return bool(_get_feasible_patterns(verb, level))
 
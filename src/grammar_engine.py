@@ -3,12 +3,17 @@ Grammar generation engine - pure functions for conjugation and sentence construc
 No I/O, no UI dependencies.
 """
 
-from typing import Optional, List
+from types import MappingProxyType
+from typing import Optional, List, Dict, Sequence, Tuple
 from src.verb_model import Verb
 
 
+# Lookup tables are read-only (MappingProxyType). Subject keys are interned
+# literals, and template subjects are interned at load time, so subject
+# lookups compare by identity.
+
 # Präsens conjugation endings
-PRÄSENS_ENDINGS = {
+PRÄSENS_ENDINGS = MappingProxyType({
     "ich": "e",
     "du": "st",
     "er": "t",
@@ -18,25 +23,27 @@ PRÄSENS_ENDINGS = {
     "ihr": "t",
     "Sie": "en",
     "sie_plural": "en"
-}
+})
 
 # Irregular verb stems in Präsens (complete forms)
-IRREGULAR_STEMS = {
-    "sein": {"du": "bist", "er": "ist", "sie": "ist", "es": "ist"},
-    "haben": {"du": "hast", "er": "hat", "sie": "hat", "es": "hat"},
-    "werden": {"du": "wirst", "er": "wird", "sie": "wird", "es": "wird"},
-    "wissen": {"du": "weißt", "er": "weiß", "sie": "weiß", "es": "weiß"},
-    "mögen": {"du": "magst", "er": "mag", "sie": "mag", "es": "mag"},
-    "können": {"du": "kannst", "er": "kann", "sie": "kann", "es": "kann"},
-    "müssen": {"du": "musst", "er": "muss", "sie": "muss", "es": "muss"},
-    "sollen": {"du": "sollst", "er": "soll", "sie": "soll", "es": "soll"},
-    "wollen": {"du": "willst", "er": "will", "sie": "will", "es": "will"},
-    "dürfen": {"du": "darfst", "er": "darf", "sie": "darf", "es": "darf"}
-}
+IRREGULAR_STEMS = MappingProxyType({
+    infinitive: MappingProxyType(forms) for infinitive, forms in {
+        "sein": {"du": "bist", "er": "ist", "sie": "ist", "es": "ist"},
+        "haben": {"du": "hast", "er": "hat", "sie": "hat", "es": "hat"},
+        "werden": {"du": "wirst", "er": "wird", "sie": "wird", "es": "wird"},
+        "wissen": {"du": "weißt", "er": "weiß", "sie": "weiß", "es": "weiß"},
+        "mögen": {"du": "magst", "er": "mag", "sie": "mag", "es": "mag"},
+        "können": {"du": "kannst", "er": "kann", "sie": "kann", "es": "kann"},
+        "müssen": {"du": "musst", "er": "muss", "sie": "muss", "es": "muss"},
+        "sollen": {"du": "sollst", "er": "soll", "sie": "soll", "es": "soll"},
+        "wollen": {"du": "willst", "er": "will", "sie": "will", "es": "will"},
+        "dürfen": {"du": "darfst", "er": "darf", "sie": "darf", "es": "darf"}
+    }.items()
+})
 
 # Vowel changes for strong verbs in Präsens (e -> i for du/er/sie/es)
 # Maps infinitive -> stem with vowel change for 2nd/3rd person singular
-VOWEL_CHANGES = {
+VOWEL_CHANGES = MappingProxyType({
     "treffen": "triff",
     "helfen": "hilf",
     "nehmen": "nimm",
@@ -46,10 +53,10 @@ VOWEL_CHANGES = {
     "essen": "iss",
     "sprechen": "sprich",
     "brechen": "brich"
-}
+})
 
 # Reflexive pronouns
-REFLEXIVE_PRONOUNS = {
+REFLEXIVE_PRONOUNS = MappingProxyType({
     "ich": "mich",
     "du": "dich",
     "er": "sich",
@@ -59,26 +66,121 @@ REFLEXIVE_PRONOUNS = {
     "ihr": "euch",
     "Sie": "sich",
     "sie_plural": "sich"
-}
+})
 
 # Case articles (definite)
-ARTICLES_DAT = {
+ARTICLES_DAT = MappingProxyType({
     "der": "dem",
     "die": "der",
     "das": "dem"
-}
+})
 
-ARTICLES_AKK = {
+ARTICLES_AKK = MappingProxyType({
     "der": "den",
     "die": "die",
     "das": "das"
-}
+})
+
+# Infinitive endings of verbs that retain -er-/-el- before personal endings
+ERN_ELN_ENDINGS = ("ern", "eln")
+
+# Stem endings that take "t" instead of "st" in the du form
+SIBILANT_STEM_ENDINGS = ("s", "ß", "z", "x")
+
+# Valencies that require an object
+OBJECT_VALENCIES = frozenset({"dat", "akk"})
+
+# Dative plural nouns (explicit list from data): "den" + one of these is dative
+DATIVE_PLURAL_NOUNS = frozenset({"Kindern", "Eltern", "Kollegen", "Freunden"})
+
+# Object case by leading article (mechanical, no inference).
+# "den" is ambiguous and handled separately in classify_object_case.
+ARTICLE_CASES = MappingProxyType({
+    "dem": "dat",
+    "der": "dat",
+    "die": "akk",
+    "das": "akk",
+    "einen": "akk",
+    "eine": "akk",
+    "ein": "akk"
+})
+
+
+def classify_object_case(obj: str) -> Optional[str]:
+    """
+    Detect the case of an object phrase from its article.
+    
+    "den" + known dative plural noun is dative, "den" + any other noun is
+    accusative masculine.
+    
+    Returns:
+        "dat", "akk", or None if the case cannot be read from the article
+    """
+    article, separator, noun = obj.partition(" ")
+    if not separator:
+        return None
+    if article == "den":
+        return "dat" if noun in DATIVE_PLURAL_NOUNS else "akk"
+    return ARTICLE_CASES.get(article)
+
+
+def partition_objects_by_case(objects: Sequence[str]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Split object phrases into dative and accusative ones (see classify_object_case).
+    
+    Phrases whose case cannot be read from the article are left out.
+    
+    Returns:
+        Tuple of (dative_objects, accusative_objects)
+    """
+    dative = []
+    accusative = []
+    for obj in objects:
+        case = classify_object_case(obj)
+        if case == "dat":
+            dative.append(obj)
+        elif case == "akk":
+            accusative.append(obj)
+    return tuple(dative), tuple(accusative)
 
 
 def conjugate_präsens(verb: Verb, subject: str) -> str:
     """
     Conjugate a verb in Präsens for the given subject.
     
+    Uses the verb's precomputed präsens_table when available (see
+    build_präsens_table), otherwise applies the rules directly.
+    
+    Raises:
+        ValueError: If conjugated form cannot be derived from explicit data or known rules
+    """
+    if verb.präsens_table is not None:
+        form = verb.präsens_table.get(subject)
+        if form is not None:
+            return form
+    return _derive_präsens(verb, subject)
+
+
+def build_präsens_table(verb: Verb) -> Dict[str, str]:
+    """
+    Precompute the Präsens forms of a verb for all known subjects.
+    
+    Subjects whose form cannot be derived are left out, so conjugate_präsens
+    falls back to the rules and raises the usual error for them.
+    """
+    table = {}
+    for subject in PRÄSENS_ENDINGS:
+        try:
+            table[subject] = _derive_präsens(verb, subject)
+        except ValueError:
+            pass
+    return table
+
+
+def _derive_präsens(verb: Verb, subject: str) -> str:
+    """
+    Derive the Präsens form of a verb for the given subject.
+    
     MECHANICAL RULES (no inference):
     1. Check explicit irregular_present overrides first
     2. Check known irregular verbs (modal verbs, etc.)
@@ -106,38 +208,28 @@ def conjugate_präsens(verb: Verb, subject: str) -> str:
     if infinitive in IRREGULAR_STEMS and subject in IRREGULAR_STEMS[infinitive]:
         return IRREGULAR_STEMS[infinitive][subject]
     
+    ending = PRÄSENS_ENDINGS.get(subject)
+    if ending is None:
+        raise ValueError(f"Cannot conjugate '{infinitive}' for subject '{subject}': unknown subject")
+    
     # Rule 3: Known morphological rule: -ern/-eln verbs retain -er- before personal endings
     # Extract verb part (remove "sich " prefix if present)
-    verb_part = infinitive
-    if infinitive.startswith("sich "):
-        verb_part = infinitive[5:]  # Remove "sich "
+    verb_part = infinitive.removeprefix("sich ")
     
-    if verb_part.endswith("ern") or verb_part.endswith("eln"):
+    if verb_part.endswith(ERN_ELN_ENDINGS):
         # Remove -n to get base, then add -er- before ending
-        base_without_n = verb_part[:-1]  # e.g., "kümmern" -> "kümmer"
-        ending = PRÄSENS_ENDINGS.get(subject)
-        if ending is None:
-            raise ValueError(f"Cannot conjugate '{infinitive}' for subject '{subject}': unknown subject")
-        return base_without_n + ending
+        return verb_part[:-1] + ending  # e.g., "kümmern" -> "kümmer" + ending
     
     # Rule 4: Regular conjugation: stem + ending
-    # Special rule for du form: stems ending in s/ß/z/tz/x use "t" not "st"
     base_stem = verb.stem
-    ending = PRÄSENS_ENDINGS.get(subject)
-    
-    if ending is None:
-        raise ValueError(f"Cannot conjugate '{infinitive}' for subject '{subject}': unknown subject")
     
     if not base_stem:
         raise ValueError(f"Cannot conjugate '{infinitive}': stem is empty")
     
-    # Special rule: du form with stems ending in s/ß/z/tz/x
-    if subject == "du" and ending == "st":
-        if base_stem and base_stem[-1] in ["s", "ß", "z", "x"]:
-            return base_stem + "t"  # e.g., "putz" + "t" = "putzt", not "putzst"
-        # Also check for "tz" ending (two characters)
-        if base_stem and len(base_stem) >= 2 and base_stem[-2:] == "tz":
-            return base_stem + "t"  # e.g., "schließ" + "t" = "schließt" (but "schließ" ends in ß, so first check handles it)
+    # Special rule: du form with stems ending in s/ß/z/x (which includes -tz)
+    # uses "t" not "st", e.g., "putz" + "t" = "putzt", not "putzst"
+    if subject == "du" and base_stem.endswith(SIBILANT_STEM_ENDINGS):
+        return base_stem + "t"
     
     return base_stem + ending
 
@@ -174,13 +266,6 @@ def build_main_clause(
     Returns:
         A complete sentence string
     """
-    if objects is None:
-        objects = []
-    if prepositional_phrases is None:
-        prepositional_phrases = []
-    if time_expressions is None:
-        time_expressions = []
-    
     # Handle separable verbs
     if verb.separable and verb.prefix:
         # In main clauses, prefix goes to the end
@@ -195,36 +280,61 @@ def build_main_clause(
     
     # Position 1: Subject (or time expression if we want to emphasize time)
     # For simplicity, we'll use subject in position 1
-    position_1 = subject.capitalize() if subject == subject.lower() else subject
+    position_1 = subject[:1].upper() + subject[1:]
     
     # Position 2: Conjugated verb (without prefix if separable)
     position_2 = verb_without_prefix
     
-    # Rest of sentence: reflexive pronoun, objects, prepositional phrases, time expressions, prefix
-    rest_parts = []
+    # Sentence parts are collected in a single list: positions 1 and 2, then
+    # the rest (reflexive pronoun, objects, prepositional phrases, time
+    # expressions, prefix)
+    sentence_parts = [position_1, position_2]
     
     # Reflexive pronoun comes early (after verb in position 2)
     if reflexive_pronoun:
-        rest_parts.append(reflexive_pronoun)
+        sentence_parts.append(reflexive_pronoun)
     
     # Objects
-    rest_parts.extend(objects)
+    if objects:
+        sentence_parts.extend(objects)
     
     # Prepositional phrases
-    rest_parts.extend(prepositional_phrases)
+    if prepositional_phrases:
+        sentence_parts.extend(prepositional_phrases)
     
     # Time expressions
-    rest_parts.extend(time_expressions)
+    if time_expressions:
+        sentence_parts.extend(time_expressions)
     
     # Separable prefix goes at the end
     if prefix:
-        rest_parts.append(prefix)
+        sentence_parts.append(prefix)
     
-    # Combine
-    sentence_parts = [position_1, position_2] + rest_parts
     return " ".join(sentence_parts)
 
 
+def ensure_generatable(verb: Verb) -> None:
+    """
+    Check that a verb may be freely generated.
+    
+    FROZEN VERB RULE: Verbs with experiencer datives, inverted semantics, or
+    impersonal subjects must not be freely generative. They require fixed_examples.
+    Examples: passieren, gehören, fehlen, gefallen, kosten
+    
+    Args:
+        verb: Verb metadata
+    
+    Raises:
+        ValueError: If the verb is frozen
+    """
+    if verb.generation_mode == "frozen":
+        raise ValueError(
+            f"Verb '{verb.infinitive}' is frozen and cannot be freely generated. "
+            "Verbs with experiencer datives, inverted semantics, or impersonal "
+            "subjects must use fixed_examples. Use fixed_examples instead."
+        )
+
+
 def generate_sentence(
     subject: str,
     verb: Verb,
@@ -255,67 +365,35 @@ def generate_sentence(
     Raises:
         ValueError: If required grammatical elements are missing
     """
-    if objects is None:
-        objects = []
-    if prepositional_phrases is None:
-        prepositional_phrases = []
-    
     # MECHANICAL VALIDATION: Check all required elements are present
     
     # Rule 0: Frozen verbs cannot be freely generated
-    # FROZEN VERB RULE: Verbs with experiencer datives, inverted semantics, or
-    # impersonal subjects must not be freely generative. They require fixed_examples.
-    # Examples: passieren, gehören, fehlen, gefallen, kosten
-    if verb.generation_mode == "frozen":
-        raise ValueError(
-            f"Verb '{verb.infinitive}' is frozen and cannot be freely generated. "
-            "Verbs with experiencer datives, inverted semantics, or impersonal "
-            "subjects must use fixed_examples. Use fixed_examples instead."
-        )
+    ensure_generatable(verb)
     
     # Rule 1: Impersonal verbs must use "es"
     if verb.impersonal and subject != "es":
         raise ValueError(f"Impersonal verb '{verb.infinitive}' requires subject 'es', got '{subject}'")
     
     # Rule 2: If valency is set, must have objects
-    if verb.valency in ["dat", "akk"]:
-        if not objects or len(objects) == 0:
+    if verb.valency in OBJECT_VALENCIES:
+        if not objects:
             raise ValueError(f"Verb '{verb.infinitive}' has valency '{verb.valency}' but no objects provided")
     
     # Rule 3: If preposition is set, must have prepositional phrases
     if verb.preposition:
-        if not prepositional_phrases or len(prepositional_phrases) == 0:
+        if not prepositional_phrases:
             raise ValueError(f"Verb '{verb.infinitive}' has preposition '{verb.preposition}' but no prepositional phrases provided")
     
     # Rule 4: If required_objects is set, must have all required cases
+    # (most verbs have none, so objects are only classified inside this branch)
     if verb.required_objects:
         required_dat = "dat" in verb.required_objects
         required_akk = "akk" in verb.required_objects
         
-        # Helper to detect case (same as in template_generator)
-        dative_plural_nouns = ["Kindern", "Eltern", "Kollegen", "Freunden"]
-        
-        def is_dative(obj: str) -> bool:
-            if obj.startswith(("dem ", "der ")):
-                return True
-            if obj.startswith("den "):
-                noun = obj[4:]
-                if noun in dative_plural_nouns:
-                    return True
-            return False
-        
-        def is_accusative(obj: str) -> bool:
-            if obj.startswith(("die ", "das ", "einen ", "eine ", "ein ")):
-                return True
-            if obj.startswith("den "):
-                noun = obj[4:]
-                if noun not in dative_plural_nouns:
-                    return True
-            return False
-        
-        # Check all required objects are present
-        has_dat = any(is_dative(obj) for obj in objects)
-        has_akk = any(is_accusative(obj) for obj in objects)
+        # Check all required objects are present (one classification per object)
+        provided_cases = {classify_object_case(obj) for obj in objects or ()}
+        has_dat = "dat" in provided_cases
+        has_akk = "akk" in provided_cases
         
         if required_dat and not has_dat:
             raise ValueError(f"Verb '{verb.infinitive}' requires dative object but none provided")
@@ -0,0 +1,21 @@
+"""
+JSON file loading.
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+
+def load_json(json_path: Path) -> Any:
+    """
+    Load and decode a UTF-8 JSON file.
+
+    The file is read as bytes: json.loads accepts UTF-8 bytes directly,
+    which skips the text-decoding layer.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file is not valid JSON (json.JSONDecodeError)
+    """
+    return json.loads(Path(json_path).read_bytes())
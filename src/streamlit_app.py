@@ -15,12 +15,64 @@ if str(project_root) not in sys.path:
 
 from src.verb_model import (
     load_verbs,
-    filter_verbs_by_level,
-    get_active_verbs,
-    select_verb_for_exercise
+    load_active_verbs,
+    build_selection_pools,
+    choose_verb_from_pools
 )
-from src.exercise_templates import find_compatible_template
-from src.config import Config, load_config
+from src.exercise_templates import find_compatible_template, TEMPLATE_PATTERNS_PATH
+from src.config import load_config
+
+
+# Streamlit re-executes the whole script on every interaction, so file loading
+# is memoized. The mtimes of the files a value is derived from are part of its
+# cache key, so edits to the JSON files are picked up without restarting the app.
+#
+# The loaded data is read-only, so it is cached as a resource: all sessions
+# share the same objects by reference instead of each access unpickling a copy.
+
+@st.cache_resource
+def _load_corpus(path: str, mtime: float, level: str):
+    """
+    Load the verbs of one level and derived lookups (cached per file version).
+    
+    Returns:
+        Tuple of (verbs, infinitive list in library order for widget options,
+        infinitive set for lookups)
+    """
+    verbs = load_verbs(Path(path), level=level)
+    infinitives = [v.infinitive for v in verbs]
+    return verbs, infinitives, frozenset(infinitives)
+
+
+@st.cache_resource
+def _cached_active(path: str, mtime: float):
+    """Load the default favourite verbs from active_verbs.json (cached per file version)."""
+    return load_active_verbs(Path(path))
+
+
+# Upper bound on cached favourites selections: resources are shared by all
+# sessions and would otherwise be kept for the lifetime of the server
+POOL_CACHE_MAX_ENTRIES = 32
+
+
+@st.cache_resource(max_entries=POOL_CACHE_MAX_ENTRIES)
+def _cached_pools(path: str, mtime: float, templates_mtime: float, level: str, active_verb_infinitives: tuple):
+    """
+    Selection pools for a favourites selection (cached per verbs and
+    template patterns file version).
+    
+    Repeated "New Exercise" clicks reuse the partition instead of rebuilding
+    it. Cached as a resource (returned by reference, not copied): the pools
+    are only read.
+    
+    Args:
+        active_verb_infinitives: Sorted favourite infinitives (hashable cache key)
+    
+    Returns:
+        Tuple of (active_pool, wider_pool)
+    """
+    verbs, _, _ = _load_corpus(path, mtime, level)
+    return build_selection_pools(verbs, active_verb_infinitives, level)
 
 
 def initialize_session_state(default_active_verbs: list):
@@ -39,6 +91,10 @@ def initialize_session_state(default_active_verbs: list):
     if "active_verbs" not in st.session_state:
         # Initialize with default favourite verbs
         st.session_state.active_verbs = default_active_verbs.copy()
+    if "active_verbs_widget" not in st.session_state:
+        # State of the favourites multiselect (keyed, so the widget keeps its
+        # identity across reruns instead of being rebuilt from a default)
+        st.session_state.active_verbs_widget = list(st.session_state.active_verbs)
     if "use_wider_pool" not in st.session_state:
         # Default: allow wider pool
         st.session_state.use_wider_pool = True
@@ -54,15 +110,18 @@ def initialize_session_state(default_active_verbs: list):
     if "user_answer" not in st.session_state:
         # Store user's typed answer
         st.session_state.user_answer = ""
+    if "rng" not in st.session_state:
+        # Per-session random generator for verb selection
+        st.session_state.rng = random.Random()
 
 
-def generate_new_exercise(all_verbs, active_verb_infinitives, use_wider_pool: bool, level="A2", active_weight: int = 75):
+def generate_new_exercise(selection_pools, active_verb_infinitives, use_wider_pool: bool, level="A2", active_weight: int = 75):
     """
     Generate a new exercise using core selection logic.
     
     Args:
-        all_verbs: Full base verb library (all available verbs)
-        active_verb_infinitives: List of favourite verb infinitives
+        selection_pools: Tuple of (active_pool, wider_pool) from build_selection_pools
+        active_verb_infinitives: Set of favourite verb infinitives
         use_wider_pool: Whether to allow selection from wider pool
         level: CEFR level
         active_weight: Percentage of selecting from favourite verbs (0-100)
@@ -70,33 +129,89 @@ def generate_new_exercise(all_verbs, active_verb_infinitives, use_wider_pool: bo
     Returns:
         Tuple of (verb, exercise, is_new_verb) or (None, None, False) if no exercise found
     """
-    # Convert percentage to decimal for select_verb_for_exercise
+    # Convert percentage to decimal for choose_verb_from_pools
     active_weight_decimal = active_weight / 100.0
     
+    active_pool, wider_pool = selection_pools
+    
     # Use core selection function (UI-agnostic)
-    verb = select_verb_for_exercise(
-        all_verbs=all_verbs,
-        active_verb_infinitives=active_verb_infinitives,
-        level=level,
+    verb = choose_verb_from_pools(
+        active_pool,
+        wider_pool,
         use_wider_pool=use_wider_pool,
-        active_weight=active_weight_decimal
+        active_weight=active_weight_decimal,
+        rng=st.session_state.rng
     )
     
     if not verb:
         return None, None, False
     
-    # Check if verb is from wider pool (new verb)
-    is_new_verb = verb.infinitive not in active_verb_infinitives
-    
-    # Find compatible template
+    # Pooled verbs all have a compatible template
     exercise = find_compatible_template(verb, level)
-    
     if not exercise:
         return None, None, False
     
+    # Check if verb is from wider pool (new verb)
+    is_new_verb = verb.infinitive not in active_verb_infinitives
+    
     return verb, exercise, is_new_verb
 
 
+def _active_set() -> frozenset:
+    """
+    Favourite verbs as a set, cached in session state.
+    
+    Rebuilt only after the favourites change (the cache is dropped wherever
+    st.session_state.active_verbs is modified).
+    """
+    active_set = st.session_state.get("_active_set")
+    if active_set is None:
+        active_set = frozenset(st.session_state.active_verbs)
+        st.session_state["_active_set"] = active_set
+    return active_set
+
+
+# Button callbacks: they run before the rerun a click triggers, so that rerun
+# already renders the new state and no explicit st.rerun() is needed.
+
+def _on_new_exercise(verbs_path: str, verbs_mtime: float, templates_mtime: float):
+    """
+    Generate a new exercise and store it in session state.
+    
+    Leaves the current exercise in place if no exercise could be generated.
+    """
+    active_set = _active_set()
+    if not active_set and not st.session_state.use_wider_pool:
+        return  # Nothing is selectable; skip building the pools
+    
+    verb, exercise, is_new = generate_new_exercise(
+        selection_pools=_cached_pools(verbs_path, verbs_mtime, templates_mtime, "A2", tuple(sorted(active_set))),
+        active_verb_infinitives=active_set,
+        use_wider_pool=st.session_state.use_wider_pool,
+        level="A2",
+        active_weight=st.session_state.active_weight
+    )
+    if verb and exercise:
+        st.session_state.verb = verb
+        st.session_state.exercise = exercise
+        st.session_state.solution_shown = False
+        st.session_state.user_answer = ""
+        st.session_state.is_new_verb = is_new
+
+
+def _on_show_solution():
+    """Reveal the solution for the current exercise."""
+    st.session_state.solution_shown = True
+
+
+def _on_add_to_favourites(infinitive: str):
+    """Add the current verb to the favourite verbs."""
+    if infinitive not in st.session_state.active_verbs:
+        st.session_state.active_verbs.append(infinitive)
+        st.session_state.active_verbs_widget = list(st.session_state.active_verbs)
+        st.session_state.pop("_active_set", None)
+
+
 def main():
     """Main Streamlit app."""
     st.set_page_config(page_title="German Grammar Generator", page_icon="🇩🇪")
@@ -104,15 +219,19 @@ def main():
     # Load data
     data_dir = Path(__file__).parent.parent / "data"
     verbs_path = data_dir / "verbs.json"
-    all_verbs = load_verbs(verbs_path)
-    a2_verbs = filter_verbs_by_level(all_verbs, "A2")
+    verbs_mtime = verbs_path.stat().st_mtime
+    templates_mtime = TEMPLATE_PATTERNS_PATH.stat().st_mtime
     
     # Load default favourite verbs from active_verbs.json
-    default_active = get_active_verbs()
+    active_verbs_path = data_dir / "active_verbs.json"
+    active_verbs_mtime = active_verbs_path.stat().st_mtime if active_verbs_path.exists() else None
+    default_active = _cached_active(str(active_verbs_path), active_verbs_mtime)
     
-    # Filter default_active to only include verbs that exist in database
-    all_verb_infinitives = [v.infinitive for v in a2_verbs]
-    valid_default_active = [v for v in default_active if v in all_verb_infinitives]
+    # Filter default_active to only include verbs that exist in database,
+    # keeping the order of active_verbs.json. The page only needs
+    # infinitives; Verb objects are materialized for selection only.
+    _, all_verb_infinitives, all_verb_infinitive_set = _load_corpus(str(verbs_path), verbs_mtime, "A2")
+    valid_default_active = [v for v in default_active if v in all_verb_infinitive_set]
     
     # Initialize session state with default favourite verbs
     initialize_session_state(valid_default_active)
@@ -120,75 +239,78 @@ def main():
     # Load config
     config = load_config()
     
+    # Drop favourites removed from verbs.json since they were selected
+    # (the multiselect rejects values that are not among its options)
+    if not all_verb_infinitive_set.issuperset(st.session_state.active_verbs_widget):
+        st.session_state.active_verbs_widget = [
+            v for v in st.session_state.active_verbs_widget if v in all_verb_infinitive_set
+        ]
+    
     # Sidebar: Configuration
     with st.sidebar:
-        st.header("⚙️ Settings")
+        # Widgets inside a form do not rerun the script on change: several
+        # settings can be adjusted and are applied together in one rerun
+        with st.form("settings"):
+            st.header("⚙️ Settings")
+            
+            show_meaning = st.checkbox(
+                "Show English meaning",
+                value=config.show_meaning
+            )
+            
+            show_assistance = st.checkbox(
+                "Show assistance",
+                value=st.session_state.show_assistance
+            )
+            
+            use_wider_pool = st.checkbox(
+                "Include new verbs",
+                value=st.session_state.use_wider_pool
+            )
+            
+            st.divider()
+            
+            st.header("📚 Favourite Verbs")
+            st.caption("Select verbs you want to practice most.")
+            selected_verbs = st.multiselect(
+                "Select verbs",
+                options=all_verb_infinitives,
+                key="active_verbs_widget"
+            )
+            st.caption(f"{len(all_verb_infinitives)} total | {len(selected_verbs)} favourite")
+            
+            active_weight = st.session_state.active_weight
+            if use_wider_pool:
+                active_weight = st.slider(
+                    "Favourite verb frequency",
+                    min_value=0,
+                    max_value=100,
+                    value=st.session_state.active_weight,
+                    step=5,
+                    format="%d%%",
+                    help="Percentage of exercises using favourite verbs (rest use new verbs)"
+                )
+                new_pct = 100 - active_weight
+                st.caption(f"{active_weight}% favourite | {new_pct}% new")
+            
+            submitted = st.form_submit_button("Apply", use_container_width=True)
         
-        show_meaning = st.checkbox(
-            "Show English meaning",
-            value=config.show_meaning
-        )
         config.show_meaning = show_meaning
-        
-        show_assistance = st.checkbox(
-            "Show assistance",
-            value=st.session_state.show_assistance
-        )
-        st.session_state.show_assistance = show_assistance
-        
-        use_wider_pool = st.checkbox(
-            "Include new verbs",
-            value=st.session_state.use_wider_pool
-        )
-        st.session_state.use_wider_pool = use_wider_pool
-        
-        st.divider()
-        
-        st.header("📚 Favourite Verbs")
-        st.caption("Select verbs you want to practice most.")
-        selected_verbs = st.multiselect(
-            "Select verbs",
-            options=all_verb_infinitives,
-            default=st.session_state.active_verbs
-        )
-        st.session_state.active_verbs = selected_verbs
-        st.caption(f"{len(a2_verbs)} total | {len(selected_verbs)} favourite")
-        
-        if use_wider_pool:
-            active_weight = st.slider(
-                "Favourite verb frequency",
-                min_value=0,
-                max_value=100,
-                value=st.session_state.active_weight,
-                step=5,
-                format="%d%%",
-                help="Percentage of exercises using favourite verbs (rest use new verbs)"
-            )
+        if submitted:
+            st.session_state.show_assistance = show_assistance
+            st.session_state.use_wider_pool = use_wider_pool
+            if selected_verbs != st.session_state.active_verbs:
+                st.session_state.pop("_active_set", None)
+            st.session_state.active_verbs = list(selected_verbs)
             st.session_state.active_weight = active_weight
-            new_pct = 100 - active_weight
-            st.caption(f"{active_weight}% favourite | {new_pct}% new")
     
     # Main content
     st.title("🇩🇪 German Grammar Generator")
     
     # Auto-generate exercise on first load or if no exercise exists
     if not st.session_state.verb or not st.session_state.exercise:
-        verb, exercise, is_new = generate_new_exercise(
-            all_verbs=a2_verbs,
-            active_verb_infinitives=st.session_state.active_verbs,
-            use_wider_pool=st.session_state.use_wider_pool,
-            level="A2",
-            active_weight=st.session_state.active_weight
-        )
-        
-        if verb and exercise:
-            st.session_state.verb = verb
-            st.session_state.exercise = exercise
-            st.session_state.solution_shown = False
-            st.session_state.user_answer = ""
-            st.session_state.is_new_verb = is_new
-            st.rerun()
-        else:
+        _on_new_exercise(str(verbs_path), verbs_mtime, templates_mtime)
+        if not st.session_state.exercise:
             st.error("No exercise found. Select more verbs or enable 'Include new verbs'.")
             st.stop()
     
@@ -209,10 +331,12 @@ def main():
         
         if is_new_verb and verb.infinitive not in st.session_state.active_verbs:
             with col2:
-                if st.button("➕ Add to favourites", key="add_to_active"):
-                    if verb.infinitive not in st.session_state.active_verbs:
-                        st.session_state.active_verbs.append(verb.infinitive)
-                    st.rerun()
+                st.button(
+                    "➕ Add to favourites",
+                    key="add_to_active",
+                    on_click=_on_add_to_favourites,
+                    args=(verb.infinitive,)
+                )
         
         if config.show_meaning and verb.english_meaning:
             st.caption(f"*{verb.english_meaning}*")
@@ -232,29 +356,18 @@ def main():
         
         if st.session_state.show_assistance:
             if not st.session_state.solution_shown:
-                if st.button("💡 Show solution", use_container_width=True):
-                    st.session_state.solution_shown = True
-                    st.rerun()
+                st.button("💡 Show solution", use_container_width=True, on_click=_on_show_solution)
             else:
                 solution = exercise.generate_solution()
                 st.success(solution)
         
         # New exercise button
-        if st.button("🔄 New Exercise", use_container_width=True):
-            verb, exercise, is_new = generate_new_exercise(
-                all_verbs=a2_verbs,
-                active_verb_infinitives=st.session_state.active_verbs,
-                use_wider_pool=st.session_state.use_wider_pool,
-                level="A2",
-                active_weight=st.session_state.active_weight
-            )
-            if verb and exercise:
-                st.session_state.verb = verb
-                st.session_state.exercise = exercise
-                st.session_state.solution_shown = False
-                st.session_state.user_answer = ""
-                st.session_state.is_new_verb = is_new
-                st.rerun()
+        st.button(
+            "🔄 New Exercise",
+            use_container_width=True,
+            on_click=_on_new_exercise,
+            args=(str(verbs_path), verbs_mtime, templates_mtime)
+        )
 
 
 if __name__ == "__main__":
@@ -4,65 +4,118 @@ Templates are patterns that match verbs based on their grammatical properties
 and generate concrete exercises.
 """
 
-import json
-import random
+import sys
 from pathlib import Path
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
-from src.verb_model import Verb
-from src.grammar_engine import generate_sentence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import product
+from types import MappingProxyType
+from random import choice as _choice, shuffle as _shuffle
+from typing import Optional, List, Dict, Any, Callable, Tuple
+from src.verb_model import (
+    Verb,
+    MATCH_REFLEXIVE,
+    MATCH_SEPARABLE,
+    MATCH_PREPOSITION,
+    VALENCY_SHIFT,
+    VALENCY_MASK,
+    VALENCY_CODES,
+    OTHER_VALENCY_CODE
+)
+from src.grammar_engine import generate_sentence, partition_objects_by_case, OBJECT_VALENCIES
+from src.json_loader import load_json
 
 
-@dataclass
+def _compile_requirements(requirements: Dict[str, Any]) -> Callable[[Verb], bool]:
+    """
+    Compile a pattern's requirements into a predicate over verbs.
+    
+    The requirements are packed once into expected bits and a mask of the
+    bits the pattern cares about, so matching a verb is a single XOR/AND
+    against its match_bits.
+    """
+    expected_bits = 0
+    care_bits = 0
+    for key, flag in (
+        ("reflexive", MATCH_REFLEXIVE),
+        ("separable", MATCH_SEPARABLE),
+        ("preposition", MATCH_PREPOSITION)
+    ):
+        if key in requirements:
+            care_bits |= flag
+            if requirements[key]:
+                expected_bits |= flag
+    
+    if "valency" in requirements:
+        valency = requirements["valency"]
+        care_bits |= VALENCY_MASK
+        expected_bits |= VALENCY_CODES.get(valency, OTHER_VALENCY_CODE) << VALENCY_SHIFT
+        if valency not in VALENCY_CODES:
+            # Uncoded valencies share one code, so also compare the value
+            def matches_other_valency(verb: Verb) -> bool:
+                return ((verb.match_bits ^ expected_bits) & care_bits) == 0 and verb.valency == valency
+            return matches_other_valency
+    
+    def matches(verb: Verb) -> bool:
+        return ((verb.match_bits ^ expected_bits) & care_bits) == 0
+    
+    return matches
+
+
+# Hint opcodes: hint_patterns keys that add a hint, resolved once per pattern
+# ("object" and "prepositional_object" hints are added with the fillers)
+_HINT_SUBJECT, _HINT_REFLEXIVE, _HINT_PREPOSITION = range(3)
+_HINT_OPCODES = MappingProxyType({
+    "subject": _HINT_SUBJECT,
+    "reflexive": _HINT_REFLEXIVE,
+    "preposition": _HINT_PREPOSITION
+})
+
+
+@dataclass(slots=True)
 class TemplatePattern:
     """Represents a template pattern that can match multiple verbs."""
     id: str
     level: str
     description: str
     requirements: Dict[str, Any]
-    subjects: List[str]
+    subjects: Tuple[str, ...]
     hint_patterns: Dict[str, Any]
     components: Dict[str, Any]
+    _predicate: Callable[[Verb], bool] = field(init=False, repr=False, compare=False)
+    _hint_ops: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._predicate = _compile_requirements(self.requirements)
+        self._hint_ops = tuple(
+            _HINT_OPCODES[key] for key in self.hint_patterns if key in _HINT_OPCODES
+        )
     
     @classmethod
     def from_dict(cls, data: dict) -> "TemplatePattern":
         """Create a TemplatePattern from a dictionary."""
+        requirements = {
+            key: sys.intern(value) if isinstance(value, str) else value
+            for key, value in data["requirements"].items()
+        }
         return cls(
             id=data["id"],
-            level=data["level"],
+            level=sys.intern(data["level"]),
             description=data["description"],
-            requirements=data["requirements"],
-            subjects=data["subjects"],
+            requirements=requirements,
+            subjects=tuple(sys.intern(subject) for subject in data["subjects"]),
             hint_patterns=data["hint_patterns"],
             components=data["components"]
         )
     
     def matches_verb(self, verb: Verb) -> bool:
-        """Check if this template pattern matches a verb's properties."""
-        req = self.requirements
-        
-        # Check reflexive requirement
-        if "reflexive" in req:
-            if req["reflexive"] != verb.reflexive:
-                return False
-        
-        # Check separable requirement
-        if "separable" in req:
-            if req["separable"] != verb.separable:
-                return False
+        """
+        Check if this template pattern matches a verb's properties.
         
-        # Check preposition requirement
-        if "preposition" in req:
-            has_prep = verb.preposition is not None
-            if req["preposition"] != has_prep:
-                return False
-        
-        # Check valency requirement
-        if "valency" in req:
-            if req["valency"] != verb.valency:
-                return False
-        
-        return True
+        Checks the reflexive, separable, preposition (present or not) and
+        valency requirements, using the predicate compiled at construction.
+        """
+        return self._predicate(verb)
 
 
 @dataclass
@@ -76,16 +129,24 @@ class ExerciseInstance:
     prepositional_phrases: Optional[List[str]] = None
     time_expressions: Optional[List[str]] = None
     description: Optional[str] = None
+    _solution: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def generate_solution(self) -> str:
-        """Generate the correct solution sentence."""
-        return generate_sentence(
-            subject=self.subject,
-            verb=self.verb,
-            objects=self.objects,
-            prepositional_phrases=self.prepositional_phrases,
-            time_expressions=self.time_expressions
-        )
+        """
+        Generate the correct solution sentence.
+        
+        The sentence is built on first call and reused afterwards (the UI
+        asks for it again on every rerun while the solution is shown).
+        """
+        if self._solution is None:
+            self._solution = generate_sentence(
+                subject=self.subject,
+                verb=self.verb,
+                objects=self.objects,
+                prepositional_phrases=self.prepositional_phrases,
+                time_expressions=self.time_expressions
+            )
+        return self._solution
 
 
 # Valency name mapping
@@ -94,12 +155,26 @@ VALENCY_NAMES = {
     "dat": "Dativ"
 }
 
+# Subjects an impersonal verb can take ("es" or a neutral subject)
+IMPERSONAL_SUBJECTS = frozenset({"es", "das", "etwas"})
+
 
 def load_template_patterns(json_path: Path) -> List[TemplatePattern]:
-    """Load template patterns from JSON file."""
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return [TemplatePattern.from_dict(item) for item in data]
+    """
+    Load template patterns from JSON file.
+    
+    Parsed patterns are cached per file (resolved path and modification
+    time); each call returns a new list of the shared patterns.
+    """
+    json_path = Path(json_path).resolve()
+    return list(_load_template_patterns_cached(json_path, json_path.stat().st_mtime))
+
+
+@lru_cache(maxsize=8)
+def _load_template_patterns_cached(json_path: Path, mtime: float) -> Tuple[TemplatePattern, ...]:
+    """Parse template patterns (mtime is only part of the cache key)."""
+    data = load_json(json_path)
+    return tuple(TemplatePattern.from_dict(item) for item in data)
 
 
 def generate_exercise_instance(
@@ -136,7 +211,7 @@ def generate_exercise_instance(
         return None  # Frozen verbs must use fixed_examples, not free generation
     
     # Rule 1: If valency is set, verb MUST have allowed_objects
-    if verb.valency in ["dat", "akk"]:
+    if verb.valency in OBJECT_VALENCIES:
         if not verb.allowed_objects or len(verb.allowed_objects) == 0:
             return None  # Invalid: valency requires objects but none defined
     
@@ -166,37 +241,31 @@ def generate_exercise_instance(
         if not verb.allowed_prepositional_objects or len(verb.allowed_prepositional_objects) == 0:
             return None  # Verb doesn't have compatible prepositional objects
     
-    # Select subject
+    # Select subject (impersonal verbs always take "es"; a random personal
+    # subject would only be rejected below)
     if subject is None:
-        subject = random.choice(pattern.subjects)
+        subject = "es" if verb.impersonal else _choice(pattern.subjects)
     
     # Enforce impersonal verb constraint: must use "es" or neutral subject
     if verb.impersonal:
-        if subject not in ["es", "das", "etwas"]:
+        if subject not in IMPERSONAL_SUBJECTS:
             return None  # Impersonal verb cannot use personal subject
         # If pattern doesn't allow "es", we can't use this verb
         if "es" not in pattern.subjects:
             return None
         subject = "es"  # Force "es" for impersonal verbs
     
-    # Generate hints
+    # Generate hints (object hints are filled from verb-specific objects below)
     hints = []
-    for hint_key, hint_value in pattern.hint_patterns.items():
-        if hint_key == "subject":
+    for op in pattern._hint_ops:
+        if op == _HINT_SUBJECT:
             hints.append(subject)
-        elif hint_key == "reflexive":
+        elif op == _HINT_REFLEXIVE:
             if verb.reflexive:
                 hints.append("sich")
-        elif hint_key == "preposition":
-            if verb.preposition:
-                valency_name = VALENCY_NAMES.get(verb.valency, verb.valency or "")
-                hints.append(f"{verb.preposition} ({valency_name})")
-        elif hint_key == "object":
-            # Will be filled from verb-specific objects
-            pass
-        elif hint_key == "prepositional_object":
-            # Will be filled from verb-specific prepositional objects
-            pass
+        elif verb.preposition:  # _HINT_PREPOSITION
+            valency_name = VALENCY_NAMES.get(verb.valency, verb.valency or "")
+            hints.append(f"{verb.preposition} ({valency_name})")
     
     # Generate components using ONLY verb-specific fillers
     objects = []
@@ -209,57 +278,37 @@ def generate_exercise_instance(
         required_dat = "dat" in verb.required_objects
         required_akk = "akk" in verb.required_objects
         
-        # Helper to detect case from article (mechanical, no inference)
-        # Dative plural nouns (explicit list from data)
-        dative_plural_nouns = ["Kindern", "Eltern", "Kollegen", "Freunden"]
-        
-        def is_dative(obj: str) -> bool:
-            if obj.startswith(("dem ", "der ")):
-                return True
-            # "den" + plural noun = dative plural (explicit check)
-            if obj.startswith("den "):
-                noun = obj[4:]  # Remove "den "
-                if noun in dative_plural_nouns:
-                    return True
-            return False
-        
-        def is_accusative(obj: str) -> bool:
-            if obj.startswith(("die ", "das ", "einen ", "eine ", "ein ")):
-                return True
-            # "den" + singular noun = accusative masculine (explicit check)
-            if obj.startswith("den "):
-                noun = obj[4:]  # Remove "den "
-                if noun not in dative_plural_nouns:
-                    return True  # Accusative if not known dative plural
-            return False
+        # Objects by case, detected from the article (mechanical, no inference).
+        # Precomputed by load_verbs; classified here for verbs built directly.
+        dat_objects, akk_objects = verb.dative_objects, verb.accusative_objects
+        if dat_objects is None or akk_objects is None:
+            dat_objects, akk_objects = partition_objects_by_case(verb.allowed_objects)
         
         # For ditransitive verbs, we need both dative and accusative objects
         if required_dat:
             # Need a dative object - must exist in allowed_objects
-            dat_objects = [obj for obj in verb.allowed_objects if is_dative(obj)]
             if not dat_objects:
                 return None  # Cannot satisfy required dative object - data incomplete
-            obj = random.choice(dat_objects)
+            obj = _choice(dat_objects)
             objects.append(obj)
             if "object" in pattern.hint_patterns:
                 hints.append(obj)
         
         if required_akk:
             # Need an accusative object - must exist in allowed_objects
-            akk_objects = [obj for obj in verb.allowed_objects if is_accusative(obj)]
             if not akk_objects:
                 return None  # Cannot satisfy required accusative object - data incomplete
-            obj = random.choice(akk_objects)
+            obj = _choice(akk_objects)
             objects.append(obj)
             if "object" in pattern.hint_patterns:
                 hints.append(obj)
     
     # Rule: If valency is set (and not required_objects), must use object from allowed_objects
-    elif verb.valency in ["dat", "akk"]:
+    elif verb.valency in OBJECT_VALENCIES:
         # valency requires an object - must be in allowed_objects
         if not verb.allowed_objects or len(verb.allowed_objects) == 0:
             return None  # Invalid: valency requires object but none defined
-        obj = random.choice(verb.allowed_objects)
+        obj = _choice(verb.allowed_objects)
         objects.append(obj)
         if "object" in pattern.hint_patterns:
             hints.append(obj)
@@ -268,7 +317,7 @@ def generate_exercise_instance(
     elif components.get("requires_object"):
         if not verb.allowed_objects or len(verb.allowed_objects) == 0:
             return None  # Template requires object but verb has none
-        obj = random.choice(verb.allowed_objects)
+        obj = _choice(verb.allowed_objects)
         objects.append(obj)
         if "object" in pattern.hint_patterns:
             hints.append(obj)
@@ -277,7 +326,7 @@ def generate_exercise_instance(
     if verb.preposition:
         if not verb.allowed_prepositional_objects or len(verb.allowed_prepositional_objects) == 0:
             return None  # Invalid: preposition requires object but none defined
-        prep_phrase = random.choice(verb.allowed_prepositional_objects)
+        prep_phrase = _choice(verb.allowed_prepositional_objects)
         prepositional_phrases.append(prep_phrase)
         if "prepositional_object" in pattern.hint_patterns:
             hints.append(prep_phrase)
@@ -286,7 +335,7 @@ def generate_exercise_instance(
     elif components.get("requires_prepositional_object"):
         if not verb.allowed_prepositional_objects or len(verb.allowed_prepositional_objects) == 0:
             return None  # Template requires prepositional object but verb has none
-        prep_phrase = random.choice(verb.allowed_prepositional_objects)
+        prep_phrase = _choice(verb.allowed_prepositional_objects)
         prepositional_phrases.append(prep_phrase)
         if "prepositional_object" in pattern.hint_patterns:
             hints.append(prep_phrase)
@@ -305,41 +354,150 @@ def generate_exercise_instance(
 
 def find_compatible_patterns(verb: Verb, level: str, patterns: List[TemplatePattern]) -> List[TemplatePattern]:
     """Find template patterns compatible with a verb and level."""
-    compatible = []
+    return [
+        pattern for pattern in patterns
+        if pattern.level == level and pattern._predicate(verb)
+    ]
+
+
+# Index key: (level, reflexive, separable, has_preposition, valency)
+PatternIndex = Dict[Tuple[Any, ...], List[TemplatePattern]]
+
+# Index valency for verb valencies no pattern asks for: such verbs can only
+# match patterns without a valency requirement, so they share one bucket
+_OTHER_VALENCY = "*"
+
+
+def build_pattern_index(patterns: List[TemplatePattern]) -> PatternIndex:
+    """
+    Index patterns by the verb properties their requirements test.
+    
+    Every possible key is enumerated per level (a pattern without a given
+    requirement is placed in all buckets for that dimension), so looking up
+    a verb's compatible patterns is a single dict access. Buckets keep the
+    patterns in their original order.
+    """
+    valencies = {_OTHER_VALENCY}
+    valencies.update(p.requirements["valency"] for p in patterns if "valency" in p.requirements)
+    
+    index: PatternIndex = {}
+    for level in dict.fromkeys(p.level for p in patterns):
+        for key in product([level], (True, False), (True, False), (True, False), valencies):
+            index[key] = []
+    
     for pattern in patterns:
-        if pattern.level == level and pattern.matches_verb(verb):
-            compatible.append(pattern)
-    return compatible
+        req = pattern.requirements
+        for key in product(
+            [pattern.level],
+            [req["reflexive"]] if "reflexive" in req else (True, False),
+            [req["separable"]] if "separable" in req else (True, False),
+            [req["preposition"]] if "preposition" in req else (True, False),
+            [req["valency"]] if "valency" in req else valencies
+        ):
+            if key in index:
+                index[key].append(pattern)
+    return index
 
 
-def generate_exercise_for_verb(
+def lookup_patterns(verb: Verb, level: str, pattern_index: PatternIndex) -> List[TemplatePattern]:
+    """Find template patterns compatible with a verb and level using an index."""
+    key = (level, verb.reflexive, verb.separable, verb.preposition is not None, verb.valency)
+    bucket = pattern_index.get(key)
+    if bucket is None:
+        bucket = pattern_index.get(key[:4] + (_OTHER_VALENCY,), [])
+    return bucket
+
+
+def _pattern_feasible(pattern: TemplatePattern, verb: Verb) -> bool:
+    """
+    Check whether an exercise can be generated from a pattern for a verb.
+    
+    Applies the same data checks as generate_exercise_instance without
+    choosing fillers or building hints. Impersonal verbs are generated with
+    the "es" subject, so the pattern must offer it.
+    """
+    if verb.generation_mode == "frozen":
+        return False
+    
+    has_objects = bool(verb.allowed_objects)
+    has_prepositional_objects = bool(verb.allowed_prepositional_objects)
+    components = pattern.components
+    
+    if not has_objects and (
+        verb.valency in OBJECT_VALENCIES
+        or verb.required_objects
+        or components.get("requires_object")
+    ):
+        return False
+    if not has_prepositional_objects and (
+        verb.preposition or components.get("requires_prepositional_object")
+    ):
+        return False
+    
+    if verb.impersonal and "es" not in pattern.subjects:
+        return False
+    
+    if verb.required_objects:
+        dat_objects, akk_objects = verb.dative_objects, verb.accusative_objects
+        if dat_objects is None or akk_objects is None:
+            dat_objects, akk_objects = partition_objects_by_case(verb.allowed_objects)
+        if "dat" in verb.required_objects and not dat_objects:
+            return False
+        if "akk" in verb.required_objects and not akk_objects:
+            return False
+    
+    return True
+
+
+def find_feasible_patterns(
     verb: Verb,
     level: str,
     patterns: List[TemplatePattern],
-    subject: Optional[str] = None
-) -> Optional[ExerciseInstance]:
+    pattern_index: Optional[PatternIndex] = None
+) -> List[TemplatePattern]:
     """
-    Generate an exercise instance for a verb.
-    Only uses patterns where verb has required semantic fillers.
+    Find the compatible patterns an exercise can actually be generated from.
+    
+    A pattern can match a verb's properties and still lack fillers (e.g. the
+    verb has no allowed objects). A pattern is feasible if an instance can be
+    generated with at least one of its subjects (see _pattern_feasible). The
+    result only depends on verb data, so callers can cache it per (verb, level).
     
     Args:
         verb: The verb
         level: CEFR level
         patterns: List of available template patterns
+        pattern_index: Optional index of patterns (see build_pattern_index)
+    """
+    if pattern_index is not None:
+        compatible = lookup_patterns(verb, level, pattern_index)
+    else:
+        compatible = find_compatible_patterns(verb, level, patterns)
+    return [pattern for pattern in compatible if _pattern_feasible(pattern, verb)]
+
+
+def generate_exercise_from_patterns(
+    verb: Verb,
+    candidates: List[TemplatePattern],
+    subject: Optional[str] = None
+) -> Optional[ExerciseInstance]:
+    """
+    Generate an exercise from the first candidate pattern that works, in random order.
+    
+    Args:
+        verb: The verb
+        candidates: Patterns to try (not modified)
         subject: Optional specific subject
     
     Returns:
-        An ExerciseInstance or None if no compatible pattern with fillers found
+        An ExerciseInstance or None if no candidate had the required fillers
     """
-    compatible = find_compatible_patterns(verb, level, patterns)
-    if not compatible:
-        return None
-    
     # Shuffle to randomize selection
-    random.shuffle(compatible)
+    candidates = list(candidates)
+    _shuffle(candidates)
     
-    # Try each compatible pattern until one works (has required fillers)
-    for pattern in compatible:
+    # Try each candidate pattern until one works (has required fillers)
+    for pattern in candidates:
         instance = generate_exercise_instance(pattern, verb, subject)
         if instance is not None:
             return instance
@@ -347,3 +505,31 @@ def generate_exercise_for_verb(
     # No pattern had required fillers
     return None
 
+
+def generate_exercise_for_verb(
+    verb: Verb,
+    level: str,
+    patterns: List[TemplatePattern],
+    subject: Optional[str] = None,
+    pattern_index: Optional[PatternIndex] = None
+) -> Optional[ExerciseInstance]:
+    """
+    Generate an exercise instance for a verb.
+    Only uses patterns where verb has required semantic fillers.
+    
+    Args:
+        verb: The verb
+        level: CEFR level
+        patterns: List of available template patterns
+        subject: Optional specific subject
+        pattern_index: Optional index of patterns (see build_pattern_index);
+                       replaces the linear scan over patterns when given
+    
+    Returns:
+        An ExerciseInstance or None if no compatible pattern with fillers found
+    """
+    feasible = find_feasible_patterns(verb, level, patterns, pattern_index)
+    if not feasible:
+        return None
+    
+    return generate_exercise_from_patterns(verb, feasible, subject)
@@ -2,13 +2,55 @@
 Verb data model and loading logic.
 """
 
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Tuple
-import json
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import AbstractSet, Iterable, Optional, List, Dict, Tuple, Sequence
+import random
+import sys
 from pathlib import Path
+from types import MappingProxyType
+from src.json_loader import load_json
 
 
-@dataclass
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a short, frequently repeated string value (None passes through)."""
+    return sys.intern(value) if value is not None else None
+
+
+def _as_set(values: Iterable[str]) -> AbstractSet[str]:
+    """Use a set of infinitives as-is; freeze any other iterable once for O(1) lookups."""
+    return values if isinstance(values, (set, frozenset)) else frozenset(values)
+
+
+def _as_tuple(values: Optional[List[str]]) -> Optional[Tuple[str, ...]]:
+    """Freeze a list of strings into a tuple (None passes through)."""
+    return tuple(values) if values is not None else None
+
+
+# Bit layout of Verb.match_bits: the properties template requirements test,
+# packed so a pattern can check all of them with one XOR/AND
+MATCH_REFLEXIVE = 1
+MATCH_SEPARABLE = 2
+MATCH_PREPOSITION = 4
+VALENCY_SHIFT = 3
+VALENCY_MASK = 3 << VALENCY_SHIFT
+VALENCY_CODES = MappingProxyType({None: 0, "akk": 1, "dat": 2})
+OTHER_VALENCY_CODE = 3  # Any valency not in VALENCY_CODES
+
+
+def encode_match_bits(reflexive: bool, separable: bool, has_preposition: bool, valency: Optional[str]) -> int:
+    """Pack the verb properties template requirements test (see MATCH_* constants)."""
+    bits = VALENCY_CODES.get(valency, OTHER_VALENCY_CODE) << VALENCY_SHIFT
+    if reflexive:
+        bits |= MATCH_REFLEXIVE
+    if separable:
+        bits |= MATCH_SEPARABLE
+    if has_preposition:
+        bits |= MATCH_PREPOSITION
+    return bits
+
+
+@dataclass(slots=True, frozen=True)
 class Verb:
     """
     Represents a German verb with its grammatical properties.
@@ -32,6 +74,9 @@ class Verb:
     3. Free substitution produces misleading but grammatical sentences
     
     DO NOT reintroduce these verbs as normal valency verbs.
+    
+    Verbs are immutable (and hashable) once created; load_verbs shares the
+    same instances between callers.
     """
     infinitive: str
     stem: str
@@ -42,38 +87,48 @@ class Verb:
     valency: Optional[str]  # "akk", "dat", or None
     partizip_ii: Optional[str]
     auxiliary: str  # "haben" or "sein"
-    levels: List[str]
+    levels: Sequence[str]  # tuple when loaded
     english_meaning: Optional[str] = None
-    allowed_objects: Optional[List[str]] = None  # Verb-specific objects (Akk/Dat)
-    allowed_prepositional_objects: Optional[List[str]] = None  # Verb-specific prepositional objects
-    irregular_present: Optional[Dict[str, str]] = None  # Explicit Präsens overrides (e.g., {"du": "isst", "er": "isst"})
-    required_objects: Optional[List[str]] = None  # Required object cases, e.g., ["dat", "akk"] for ditransitive verbs
+    allowed_objects: Optional[Sequence[str]] = None  # Verb-specific objects (Akk/Dat); tuple when loaded
+    allowed_prepositional_objects: Optional[Sequence[str]] = None  # Verb-specific prepositional objects; tuple when loaded
+    irregular_present: Optional[Dict[str, str]] = field(default=None, hash=False)  # Explicit Präsens overrides (e.g., {"du": "isst", "er": "isst"})
+    required_objects: Optional[List[str]] = field(default=None, hash=False)  # Required object cases, e.g., ["dat", "akk"] for ditransitive verbs
     impersonal: bool = False  # True if verb is impersonal (requires es/neutral subject)
     generation_mode: Optional[str] = None  # "frozen" if verb cannot be freely generated (requires fixed_examples)
-    fixed_examples: Optional[List[str]] = None  # Predefined sentence templates for frozen verbs
+    fixed_examples: Optional[Sequence[str]] = None  # Predefined sentence templates for frozen verbs; tuple when loaded
+    präsens_table: Optional[Dict[str, str]] = field(default=None, repr=False, compare=False)  # Precomputed Präsens forms (set by load_verbs)
+    dative_objects: Optional[Tuple[str, ...]] = field(default=None, repr=False, compare=False)  # allowed_objects in the dative (set by load_verbs)
+    accusative_objects: Optional[Tuple[str, ...]] = field(default=None, repr=False, compare=False)  # allowed_objects in the accusative (set by load_verbs)
+    match_bits: int = field(init=False, repr=False, compare=False)  # Packed matching properties (see encode_match_bits)
+
+    def __post_init__(self):
+        # Derived field: bypass the frozen __setattr__
+        object.__setattr__(self, "match_bits", encode_match_bits(
+            self.reflexive, self.separable, self.preposition is not None, self.valency
+        ))
 
     @classmethod
     def from_dict(cls, data: dict) -> "Verb":
         """Create a Verb instance from a dictionary."""
         return cls(
-            infinitive=data["infinitive"],
+            infinitive=sys.intern(data["infinitive"]),
             stem=data["stem"],
             separable=data["separable"],
-            prefix=data.get("prefix", ""),
+            prefix=sys.intern(data.get("prefix", "")),
             reflexive=data["reflexive"],
-            preposition=data.get("preposition"),
-            valency=data.get("valency"),
+            preposition=_intern(data.get("preposition")),
+            valency=_intern(data.get("valency")),
             partizip_ii=data.get("partizip_ii"),
-            auxiliary=data["auxiliary"],
-            levels=data["levels"],
+            auxiliary=sys.intern(data["auxiliary"]),
+            levels=tuple(sys.intern(level) for level in data["levels"]),
             english_meaning=data.get("english_meaning"),
-            allowed_objects=data.get("allowed_objects"),
-            allowed_prepositional_objects=data.get("allowed_prepositional_objects"),
+            allowed_objects=_as_tuple(data.get("allowed_objects")),
+            allowed_prepositional_objects=_as_tuple(data.get("allowed_prepositional_objects")),
             irregular_present=data.get("irregular_present"),
             required_objects=data.get("required_objects"),
             impersonal=data.get("impersonal", False),
-            generation_mode=data.get("generation_mode"),
-            fixed_examples=data.get("fixed_examples")
+            generation_mode=_intern(data.get("generation_mode")),
+            fixed_examples=_as_tuple(data.get("fixed_examples"))
         )
 
     def to_dict(self) -> dict:
@@ -88,21 +143,40 @@ class Verb:
             "valency": self.valency,
             "partizip_ii": self.partizip_ii,
             "auxiliary": self.auxiliary,
-            "levels": self.levels,
+            "levels": list(self.levels),
             "english_meaning": self.english_meaning
         }
 
 
-def load_verbs(json_path: Path) -> List[Verb]:
+def load_verbs(json_path: Path, level: Optional[str] = None) -> List[Verb]:
     """
     Load verbs from a JSON file.
     
     VALIDATION: Frozen verbs must have fixed_examples.
     Verbs with experiencer datives, inverted semantics, or impersonal subjects
     must not be freely generative.
+    
+    Parsed verbs are cached per file (resolved path and modification time)
+    and level; each call returns a new list of the shared Verb objects.
+    
+    Args:
+        json_path: Path to verbs.json
+        level: Optional CEFR level; if given, only verbs at that level are
+               loaded (other entries are never turned into Verb objects)
     """
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    json_path = Path(json_path).resolve()
+    return list(_load_verbs_cached(json_path, json_path.stat().st_mtime, level))
+
+
+@lru_cache(maxsize=8)
+def _load_verbs_cached(json_path: Path, mtime: float, level: Optional[str]) -> Tuple[Verb, ...]:
+    """Parse, validate and precompute verbs (mtime is only part of the cache key)."""
+    data = load_json(json_path)
+    
+    from src.grammar_engine import build_präsens_table, partition_objects_by_case
+    
+    if level is not None:
+        data = [item for item in data if level in item["levels"]]
     
     verbs = [Verb.from_dict(item) for item in data]
     
@@ -116,7 +190,19 @@ def load_verbs(json_path: Path) -> List[Verb]:
                     "subjects cannot be freely generated."
                 )
     
-    return verbs
+    # Conjugate and classify objects once at load time; conjugate_präsens and
+    # exercise generation then only do lookups
+    loaded = []
+    for verb in verbs:
+        dative_objects, accusative_objects = partition_objects_by_case(verb.allowed_objects or ())
+        loaded.append(replace(
+            verb,
+            präsens_table=build_präsens_table(verb),
+            dative_objects=dative_objects,
+            accusative_objects=accusative_objects
+        ))
+    
+    return tuple(loaded)
 
 
 def filter_verbs_by_level(verbs: List[Verb], level: str) -> List[Verb]:
@@ -124,56 +210,145 @@ def filter_verbs_by_level(verbs: List[Verb], level: str) -> List[Verb]:
     return [v for v in verbs if level in v.levels]
 
 
-def load_active_verbs(json_path: Path) -> List[str]:
-    """Load active verb list from JSON file."""
+def load_active_verbs(json_path: Path) -> Tuple[str, ...]:
+    """Load the active verbs from a JSON file in file order (empty if missing)."""
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data.get("active_verbs", [])
+        data = load_json(json_path)
+        return tuple(data.get("active_verbs", []))
     except FileNotFoundError:
-        return []
+        return ()
 
 
-def get_active_verbs(override: Optional[List[str]] = None) -> List[str]:
+def get_active_verbs(override: Optional[List[str]] = None) -> AbstractSet[str]:
     """
-    Get active verbs list.
+    Get active verbs set.
+    
+    Returned as a frozenset because callers only test membership
+    (O(1) per verb instead of a list scan).
     
     Args:
         override: Optional list to use instead of loading from file.
                   If None, loads from active_verbs.json
     
     Returns:
-        List of active verb infinitives
+        Frozenset of active verb infinitives
     """
     if override is not None:
-        return override
+        return frozenset(override)
     
     # Default: load from file
     data_dir = Path(__file__).parent.parent / "data"
     active_verbs_path = data_dir / "active_verbs.json"
-    return load_active_verbs(active_verbs_path)
+    return frozenset(load_active_verbs(active_verbs_path))
 
 
 def prioritize_active_verbs(
     verbs: List[Verb],
-    active_verb_infinitives: List[str],
+    active_verb_infinitives: Iterable[str],
     level: str
 ) -> List[Verb]:
     """
     Prioritize active verbs while keeping all verbs available.
     Returns verbs with active verbs first, then others.
     """
-    active = [v for v in verbs if v.infinitive in active_verb_infinitives and level in v.levels]
-    others = [v for v in verbs if v.infinitive not in active_verb_infinitives and level in v.levels]
+    active_set = _as_set(active_verb_infinitives)
+    active = []
+    others = []
+    for v in verbs:
+        if level in v.levels:
+            (active if v.infinitive in active_set else others).append(v)
     return active + others
 
 
+def build_selection_pools(
+    all_verbs: List[Verb],
+    active_verb_infinitives: Iterable[str],
+    level: str
+) -> Tuple[List[Verb], List[Verb]]:
+    """
+    Build the pools that exercise selection draws from.
+    
+    Only verbs at the given level that are not frozen and have a compatible
+    template are selectable.
+    
+    Returns:
+        Tuple of (active_pool, wider_pool)
+    """
+    from src.exercise_templates import has_compatible_template
+    
+    active_set = _as_set(active_verb_infinitives)
+    active_pool = []
+    wider_pool = []
+    for verb in all_verbs:
+        if level not in verb.levels:
+            continue
+        if verb.generation_mode == "frozen":  # Exclude frozen verbs from free generation
+            continue
+        if not has_compatible_template(verb, level):
+            continue
+        if verb.infinitive in active_set:
+            active_pool.append(verb)
+        else:
+            wider_pool.append(verb)
+    return active_pool, wider_pool
+
+
+def _choose_pool(
+    active_pool: Sequence[Verb],
+    wider_pool: Sequence[Verb],
+    use_wider_pool: bool,
+    active_weight: float,
+    rng: random.Random
+) -> Sequence[Verb]:
+    """
+    Pick the pool the next verb is drawn from (favourites vs. new verbs).
+    
+    Shared by all selection functions so they weight the pools the same way.
+    
+    Returns:
+        The chosen pool (empty if no pool has verbs)
+    """
+    # Only one pool can contribute: use it directly
+    if not use_wider_pool or not wider_pool:
+        return active_pool
+    if not active_pool:
+        return wider_pool
+    
+    # Weighted choice of the pool
+    return rng.choices((active_pool, wider_pool), weights=(active_weight, 1 - active_weight))[0]
+
+
+def choose_verb_from_pools(
+    active_pool: List[Verb],
+    wider_pool: List[Verb],
+    use_wider_pool: bool = True,
+    active_weight: float = 0.75,
+    rng: Optional[random.Random] = None
+) -> Optional[Verb]:
+    """
+    Pick a verb from prebuilt selection pools (see build_selection_pools).
+    
+    Args:
+        rng: Optional random number generator (defaults to the random module)
+    
+    Returns:
+        Selected Verb object, or None if no suitable verb found.
+    """
+    if rng is None:
+        rng = random
+    
+    # Weighted choice of the pool, then a uniform choice within it
+    pool = _choose_pool(active_pool, wider_pool, use_wider_pool, active_weight, rng)
+    return rng.choice(pool) if pool else None
+
+
 def select_verb_for_exercise(
     all_verbs: List[Verb],
-    active_verb_infinitives: List[str],
+    active_verb_infinitives: Iterable[str],
     level: str,
     use_wider_pool: bool = True,
-    active_weight: float = 0.75
+    active_weight: float = 0.75,
+    rng: Optional[random.Random] = None
 ) -> Optional[Verb]:
     """
     Select a verb for exercise generation.
@@ -182,66 +357,57 @@ def select_verb_for_exercise(
     
     Args:
         all_verbs: Full base verb library (all available verbs)
-        active_verb_infinitives: List of active verb infinitives (priority verbs)
+        active_verb_infinitives: Active verb infinitives (priority verbs); a set is used as-is
         level: CEFR level (e.g., "A2")
         use_wider_pool: If True, allows selection from wider pool (non-active verbs).
                        If False, only selects from active verbs.
         active_weight: Probability of selecting from active verbs (0.0-1.0).
                       Default 0.75 (75% active, 25% wider pool).
+        rng: Optional random number generator (defaults to the random module).
+             Pass a random.Random to keep per-session or seeded state.
     
     Returns:
         Selected Verb object, or None if no suitable verb found.
     """
-    import random
-    from src.exercise_templates import find_compatible_template
-    
-    # Filter to level
-    level_verbs = [v for v in all_verbs if level in v.levels]
-    
-    if not level_verbs:
-        return None
-    
-    # Filter to verbs with compatible templates and exclude frozen verbs
-    verbs_with_templates = [
-        verb for verb in level_verbs
-        if verb.generation_mode != "frozen"  # Exclude frozen verbs from free generation
-        and find_compatible_template(verb, level) is not None
-    ]
-    
-    if not verbs_with_templates:
-        return None
-    
-    # Split into active and wider pool
-    active_with_templates = [
-        v for v in verbs_with_templates
-        if v.infinitive in active_verb_infinitives
-    ]
-    
-    wider_pool = [
-        v for v in verbs_with_templates
-        if v.infinitive not in active_verb_infinitives
-    ]
-    
-    # Selection logic
-    if not use_wider_pool:
-        # Only from active verbs
-        if active_with_templates:
-            return random.choice(active_with_templates)
+    from src.exercise_templates import has_compatible_template
+    
+    if rng is None:
+        rng = random
+    
+    active_set = _as_set(active_verb_infinitives)
+    if not active_set and not use_wider_pool:
+        return None  # Only active verbs are eligible and there are none
+    
+    # Single pass over the library: instead of building both pools, keep one
+    # uniformly drawn candidate per pool (reservoir sampling with k=1)
+    active_choice, active_count = None, 0
+    wider_choice, wider_count = None, 0
+    for verb in all_verbs:
+        if level not in verb.levels:
+            continue
+        if verb.generation_mode == "frozen":  # Exclude frozen verbs from free generation
+            continue
+        is_active = verb.infinitive in active_set
+        if not is_active and not use_wider_pool:
+            continue
+        if not has_compatible_template(verb, level):
+            continue
+        if is_active:
+            active_count += 1
+            if rng.randrange(active_count) == 0:
+                active_choice = verb
         else:
-            # Fallback: no active verbs available, return None
-            return None
-    
-    # Use weighted selection between active and wider pool
-    if active_with_templates and random.random() < active_weight:
-        # Select from active verbs
-        return random.choice(active_with_templates)
-    elif wider_pool:
-        # Select from wider pool
-        return random.choice(wider_pool)
-    elif active_with_templates:
-        # Fallback: only active verbs available
-        return random.choice(active_with_templates)
-    else:
-        # No verbs available
-        return None
-
+            wider_count += 1
+            if rng.randrange(wider_count) == 0:
+                wider_choice = verb
+    
+    # Each candidate stands for its whole pool (it was drawn uniformly from
+    # it), so the pool choice decides between them
+    pool = _choose_pool(
+        (active_choice,) if active_choice is not None else (),
+        (wider_choice,) if wider_choice is not None else (),
+        use_wider_pool,
+        active_weight,
+        rng
+    )
+    return pool[0] if pool else None
@@ -6,16 +6,46 @@ No randomness, no UI/CLI dependencies.
 """
 
 import json
+import random
 import pytest
+from dataclasses import replace
+from itertools import product
 from pathlib import Path
 
-from src.verb_model import Verb
-from src.grammar_engine import conjugate_präsens
+from src.verb_model import (
+    Verb,
+    load_verbs,
+    get_active_verbs,
+    build_selection_pools,
+    choose_verb_from_pools,
+    select_verb_for_exercise
+)
+from src.grammar_engine import (
+    conjugate_präsens,
+    build_main_clause,
+    build_präsens_table,
+    classify_object_case,
+    partition_objects_by_case,
+    PRÄSENS_ENDINGS
+)
+from src.template_generator import (
+    TemplatePattern,
+    generate_exercise_instance,
+    _pattern_feasible,
+    load_template_patterns,
+    build_pattern_index,
+    lookup_patterns,
+    find_compatible_patterns
+)
+from src import exercise_templates
 
 
 # Load verbs once for all tests
 _VERBS_CACHE = None
 
+# Verb objects by infinitive, built once on first lookup
+_VERB_INDEX = None
+
 
 def _load_verbs():
     """Load verbs from JSON file."""
@@ -30,9 +60,10 @@ def _load_verbs():
 
 def _get_verb(infinitive: str) -> Verb:
     """Get a Verb object by infinitive."""
-    verbs = _load_verbs()
-    verb_dict = [v for v in verbs if v["infinitive"] == infinitive][0]
-    return Verb.from_dict(verb_dict)
+    global _VERB_INDEX
+    if _VERB_INDEX is None:
+        _VERB_INDEX = {v["infinitive"]: Verb.from_dict(v) for v in _load_verbs()}
+    return _VERB_INDEX[infinitive]
 
 
 # ============================================================================
@@ -461,6 +492,28 @@ def test_impersonal_verb_subject_constraint():
             assert instance.subject == "es", f"Impersonal verb must use 'es', got '{instance.subject}'"
 
 
+def test_impersonal_verb_feasibility_matches_generation():
+    """Test that a pattern feasible for an impersonal verb always generates with 'es'"""
+    verb = replace(_get_verb("passieren"), generation_mode=None)  # Freely generative copy
+    
+    def make_pattern(subjects):
+        return TemplatePattern(
+            id="impersonal_test", level="A2", description="", requirements={},
+            subjects=subjects, hint_patterns={"subject": True}, components={}
+        )
+    
+    with_es = make_pattern(("ich", "du", "es"))
+    assert _pattern_feasible(with_es, verb)
+    for _ in range(50):
+        instance = generate_exercise_instance(with_es, verb)
+        assert instance is not None
+        assert instance.subject == "es"
+    
+    without_es = make_pattern(("ich", "du"))
+    assert not _pattern_feasible(without_es, verb)
+    assert generate_exercise_instance(without_es, verb) is None
+
+
 # ============================================================================
 # 12. Mechanical validation tests (no inference, explicit data only)
 # ============================================================================
@@ -574,4 +627,212 @@ def test_impersonal_verb_must_use_es():
         generate_sentence("du", verb, objects=["mir"])
         assert False, "Should raise ValueError when impersonal verb uses personal subject"
     except ValueError as e:
-        assert "impersonal" in str(e).lower() or "es" in str(e).lower()
\ No newline at end of file
+        assert "impersonal" in str(e).lower() or "es" in str(e).lower()
+
+# ============================================================================
+# 13. Precomputed conjugation table (load-time partial evaluation)
+# ============================================================================
+
+def test_präsens_table_matches_rules():
+    """Test that load_verbs' precomputed präsens_table agrees with the rules"""
+    data_dir = Path(__file__).parent.parent / "data"
+    verbs = load_verbs(data_dir / "verbs.json")
+    
+    for verb in verbs:
+        assert verb.präsens_table is not None
+        rules_only = _get_verb(verb.infinitive)  # from_dict: no table, rules only
+        assert rules_only.präsens_table is None
+        for subject in PRÄSENS_ENDINGS:
+            assert conjugate_präsens(verb, subject) == conjugate_präsens(rules_only, subject)
+    
+    essen = _get_verb("essen")
+    assert build_präsens_table(essen)["du"] == "isst"
+
+
+# ============================================================================
+# 14. Caches
+# ============================================================================
+
+def test_feasible_patterns_are_memoized(monkeypatch):
+    """Test that compatibility checks and generation share one feasibility search per verb"""
+    searches = []
+    find_feasible_patterns = exercise_templates.find_feasible_patterns
+    
+    def counting_find(verb, *args):
+        searches.append(verb.infinitive)
+        return find_feasible_patterns(verb, *args)
+    
+    monkeypatch.setattr(exercise_templates, "find_feasible_patterns", counting_find)
+    machen = _get_verb("machen")
+    
+    assert exercise_templates.has_compatible_template(machen, "A2")
+    searched = len(searches)
+    assert searched <= 1  # Earlier tests may already have memoized machen
+    
+    assert exercise_templates.has_compatible_template(machen, "A2")
+    first = exercise_templates.find_compatible_template(machen, "A2")
+    second = exercise_templates.find_compatible_template(machen, "A2")
+    assert first is not None and second is not None
+    assert first is not second  # Exercises themselves are generated fresh
+    assert len(searches) == searched
+
+
+def test_feasible_patterns_cache_distinguishes_verb_copies():
+    """Test that modified copies of a verb are not served the original's cached patterns"""
+    anrufen = _get_verb("anrufen")
+    assert exercise_templates.has_compatible_template(anrufen, "A2")  # Memoize the original first
+    
+    without_objects = replace(anrufen, allowed_objects=None)
+    frozen = replace(anrufen, generation_mode="frozen")
+    for verb in (without_objects, frozen):
+        assert not exercise_templates.has_compatible_template(verb, "A2")
+        assert exercise_templates.find_compatible_template(verb, "A2") is None
+
+
+# ============================================================================
+# 15. Object case classification
+# ============================================================================
+
+def test_classify_object_case():
+    """Test that object case is read from the article"""
+    assert classify_object_case("dem Freund") == "dat"
+    assert classify_object_case("der Freundin") == "dat"
+    assert classify_object_case("den Kindern") == "dat"  # Dative plural noun
+    assert classify_object_case("den Apfel") == "akk"  # Accusative masculine
+    assert classify_object_case("die Zeitung") == "akk"
+    assert classify_object_case("ein Buch") == "akk"
+    assert classify_object_case("mir") is None  # No article
+    assert classify_object_case("zehn Euro") is None  # Unknown article
+
+
+def test_partition_objects_by_case():
+    """Test that objects are split by case, keeping order and dropping unknown cases"""
+    objects = ["den Apfel", "dem Freund", "mir", "den Eltern", "eine Tasche"]
+    assert partition_objects_by_case(objects) == (
+        ("dem Freund", "den Eltern"),
+        ("den Apfel", "eine Tasche")
+    )
+    assert partition_objects_by_case([]) == ((), ())
+
+
+# ============================================================================
+# 16. Pattern index (must agree with the linear pattern scan)
+# ============================================================================
+
+def test_pattern_index_matches_linear_scan():
+    """Test that indexed pattern lookup finds the same patterns as a full scan"""
+    data_dir = Path(__file__).parent.parent / "data"
+    patterns = load_template_patterns(data_dir / "template_patterns.json")
+    index = build_pattern_index(patterns)
+    
+    for verb_dict in _load_verbs():
+        verb = Verb.from_dict(verb_dict)
+        for level in ("A2", "B1"):
+            expected = [p.id for p in find_compatible_patterns(verb, level, patterns)]
+            assert [p.id for p in lookup_patterns(verb, level, index)] == expected
+
+
+def _reference_matches_verb(requirements: dict, verb: Verb) -> bool:
+    """Field-by-field requirement check (the original matches_verb semantics)"""
+    if "reflexive" in requirements and requirements["reflexive"] != verb.reflexive:
+        return False
+    if "separable" in requirements and requirements["separable"] != verb.separable:
+        return False
+    if "preposition" in requirements and requirements["preposition"] != (verb.preposition is not None):
+        return False
+    if "valency" in requirements and requirements["valency"] != verb.valency:
+        return False
+    return True
+
+
+def _requirement_combinations():
+    """Every combination of absent/True/False flags and absent/known/uncoded valencies"""
+    flag_options = (None, True, False)  # None: requirement absent
+    valency_options = ("absent", None, "akk", "dat", "gen")
+    for reflexive, separable, preposition, valency in product(
+        flag_options, flag_options, flag_options, valency_options
+    ):
+        requirements = {}
+        for key, value in (("reflexive", reflexive), ("separable", separable), ("preposition", preposition)):
+            if value is not None:
+                requirements[key] = value
+        if valency != "absent":
+            requirements["valency"] = valency
+        yield requirements
+
+
+@pytest.mark.parametrize("requirements", list(_requirement_combinations()), ids=repr)
+def test_compiled_requirements_match_reference(requirements):
+    """Test that the compiled (bitmask) predicate agrees with the field-by-field check"""
+    pattern = TemplatePattern(
+        id="reference_test", level="A2", description="", requirements=requirements,
+        subjects=("ich",), hint_patterns={}, components={}
+    )
+    machen = _get_verb("machen")
+    verbs = [Verb.from_dict(v) for v in _load_verbs()] + [
+        replace(machen, valency="gen"),
+        replace(machen, valency="nom", preposition="auf", reflexive=True, separable=True)
+    ]
+    for verb in verbs:
+        assert pattern.matches_verb(verb) == _reference_matches_verb(requirements, verb), verb.infinitive
+
+
+# ============================================================================
+# 17. Pattern feasibility (must agree with generation)
+# ============================================================================
+
+def test_has_compatible_template_agrees_with_generation():
+    """Test that the feasibility check agrees with actual exercise generation"""
+    data_dir = Path(__file__).parent.parent / "data"
+    for verb in load_verbs(data_dir / "verbs.json", level="A2"):
+        generated = exercise_templates.find_compatible_template(verb, "A2")
+        assert exercise_templates.has_compatible_template(verb, "A2") == (generated is not None), verb.infinitive
+
+
+# ============================================================================
+# 18. Sentence construction
+# ============================================================================
+
+def test_subject_capitalization_keeps_rest_of_subject():
+    """Test that only the first letter of the subject is capitalized"""
+    verb = _get_verb("machen")
+    
+    assert build_main_clause("ich", verb, "mache").startswith("Ich mache")
+    assert build_main_clause("der Mann", verb, "macht").startswith("Der Mann macht")
+    assert build_main_clause("meine Freundin Anna", verb, "macht").startswith("Meine Freundin Anna macht")
+    assert build_main_clause("Sie", verb, "machen").startswith("Sie machen")
+
+
+# ============================================================================
+# 19. Verb selection (favourites vs. new verbs)
+# ============================================================================
+
+def test_selection_functions_share_pool_weighting():
+    """Test that both selection functions split favourites/new verbs by active_weight"""
+    data_dir = Path(__file__).parent.parent / "data"
+    verbs = load_verbs(data_dir / "verbs.json", level="A2")
+    active = get_active_verbs()
+    active_pool, wider_pool = build_selection_pools(verbs, active, "A2")
+    assert active_pool and wider_pool
+    
+    draws = 4000
+    pool_rng = random.Random(1)
+    scan_rng = random.Random(2)
+    pool_hits = sum(
+        choose_verb_from_pools(active_pool, wider_pool, active_weight=0.75, rng=pool_rng).infinitive in active
+        for _ in range(draws)
+    )
+    scan_hits = sum(
+        select_verb_for_exercise(verbs, active, "A2", active_weight=0.75, rng=scan_rng).infinitive in active
+        for _ in range(draws)
+    )
+    
+    assert abs(pool_hits / draws - 0.75) < 0.03
+    assert abs(scan_hits / draws - 0.75) < 0.03
+    assert abs(pool_hits - scan_hits) / draws < 0.04
+    
+    # Without the wider pool only favourites are chosen
+    rng = random.Random(3)
+    for _ in range(100):
+        assert choose_verb_from_pools(active_pool, wider_pool, use_wider_pool=False, rng=rng).infinitive in active
+        assert select_verb_for_exercise(verbs, active, "A2", use_wider_pool=False, rng=rng).infinitive in active
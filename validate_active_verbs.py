@@ -1,17 +1,14 @@
 """Validate active verbs list."""
-import json
 from pathlib import Path
 
+from src.json_loader import load_json
+
 # Load data
 active_verbs_path = Path("data/active_verbs.json")
 verbs_path = Path("data/verbs.json")
 
-with open(active_verbs_path, "r", encoding="utf-8") as f:
-    active_data = json.load(f)
-    active_verbs = active_data["active_verbs"]
-
-with open(verbs_path, "r", encoding="utf-8") as f:
-    all_verbs = json.load(f)
+active_verbs = load_json(active_verbs_path)["active_verbs"]
+all_verbs = load_json(verbs_path)
 
 # Create lookup
 verb_lookup = {v["infinitive"]: v for v in all_verbs}
@@ -22,37 +19,35 @@ print("=" * 80)
 print(f"\nTotal verbs in list: {len(active_verbs)}")
 print(f"Unique verbs: {len(set(active_verbs))}")
 
-# Check for duplicates
+# Check duplicates, existence, A2 level and frozen status in one pass
 duplicates = []
+missing = []
+not_a2 = []
+frozen = []
 seen = set()
 for v in active_verbs:
     if v in seen:
         duplicates.append(v)
     seen.add(v)
+    verb = verb_lookup.get(v)
+    if verb is None:
+        missing.append(v)
+        continue
+    if "A2" not in verb.get("levels", ()):
+        not_a2.append(v)
+    if verb.get("generation_mode") == "frozen":
+        frozen.append(v)
 
 if duplicates:
     print(f"\n[ERROR] Duplicates found: {duplicates}")
 else:
     print("\n[OK] No duplicates")
 
-# Check if all exist
-missing = [v for v in active_verbs if v not in verb_lookup]
 if missing:
     print(f"\n[ERROR] Missing from database: {missing}")
 else:
     print("\n[OK] All verbs exist in database")
 
-# Check A2 level
-not_a2 = []
-frozen = []
-for v in active_verbs:
-    if v in verb_lookup:
-        verb = verb_lookup[v]
-        if "A2" not in verb.get("levels", []):
-            not_a2.append(v)
-        if verb.get("generation_mode") == "frozen":
-            frozen.append(v)
-
 if not_a2:
     print(f"\n[WARNING] Not A2 level: {not_a2}")
 else:
@@ -81,15 +76,15 @@ categories = {
     "Mental": ["denken"]
 }
 
+active_set = set(active_verbs)
+a2_verbs = {inf for inf, verb in verb_lookup.items() if "A2" in verb.get("levels", ())}
+
 print("\nCurrent organization:")
 for cat, verbs in categories.items():
     print(f"\n{cat}:")
     for v in verbs:
-        if v in active_verbs:
-            if v in verb_lookup and "A2" in verb_lookup[v].get("levels", []):
-                status = "[OK]"
-            else:
-                status = "[ERROR]"
+        if v in active_set:
+            status = "[OK]" if v in a2_verbs else "[ERROR]"
             print(f"  {status} {v}")
 
 # Recommendations